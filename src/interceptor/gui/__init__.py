@@ -1,13 +1,20 @@
 import os
-import wx
 
 from interceptor import packagefinder
 
 
 icon_cache = {}
+icon_path_cache = {}
 
 
 def find_icon(icon_fn, library="tango", size=None, scale=None, extension=None):
+    # bitmaps are cached by call arguments, so that the package resources are
+    # only looked up the first time an icon is requested
+    key = (icon_fn, library, size, scale, extension)
+    bmp = icon_cache.get(key, None)
+    if bmp is not None:
+        return bmp
+
     package = ["gui_resources", "icons", library]
     if library != "custom":
         size = size if size else 32
@@ -18,16 +25,33 @@ def find_icon(icon_fn, library="tango", size=None, scale=None, extension=None):
         extension = extension if extension else "png"
         icon_fn = "{}.{}".format(icon_fn, extension)
 
-    icon_path = packagefinder(icon_fn, package)
-
-    bmp = icon_cache.get(icon_path, None)
-    if bmp is None:
-        img = wx.Image(icon_path, type=wx.BITMAP_TYPE_PNG, index=-1)
-        if scale is not None:
-            assert isinstance(scale, tuple)
-            w, h = scale
-            img = img.Scale(w, h)
-        bmp = img.ConvertToBitmap()
-        icon_cache[icon_path] = bmp
+    # resolved resource paths are cached separately, so that the same icon file
+    # is only looked up once even if requested with different scales
+    path_key = (tuple(package), icon_fn)
+    icon_path = icon_path_cache.get(path_key, None)
+    if icon_path is None:
+        icon_path = packagefinder(icon_fn, package)
+        icon_path_cache[path_key] = icon_path
+
+    # wx is imported here so that wx-free modules in this package (e.g.
+    # chart_utils) can be imported without a GUI toolkit
+    import wx
+
+    img = wx.Image(icon_path, type=wx.BITMAP_TYPE_PNG, index=-1)
+    if scale is not None:
+        assert isinstance(scale, tuple)
+        w, h = scale
+        img = img.Scale(w, h)
+    bmp = img.ConvertToBitmap()
+    icon_cache[key] = bmp
 
     return bmp
+
+
+def preload_icons(icons):
+    """ Load a set of icons into the icon cache ahead of time (must be called
+    after the wx.App has been created)
+    :param icons: an iterable of (icon_fn, find_icon kwargs) pairs
+    """
+    for icon_fn, kwargs in icons:
+        find_icon(icon_fn, **kwargs)
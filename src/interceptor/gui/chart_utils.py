@@ -0,0 +1,124 @@
+from __future__ import absolute_import, division, print_function
+
+"""
+Created     : 10/15/2026
+Last Changed: 10/15/2026
+Description : Interceptor chart data utilities (no GUI dependencies)
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def axis_step(span):
+    """ Pick a round step (1, 2 or 5 times a power of ten) of at most 10% of a
+    span; the step stays the same over a wide range of spans
+    :param span: width of the plotted range
+    :return: step size (at least 1)
+    """
+    target = 0.1 * span
+    step = 1
+    scale = 1
+    while True:
+        for factor in (1, 2, 5):
+            if scale * factor > target:
+                return step
+            step = scale * factor
+        scale *= 10
+
+
+def decimate_points(x, y, x_min, x_max, y_min, y_max, n_xbins, n_ybins):
+    """ Reduce a set of points to one point per occupied cell of an n_xbins by
+    n_ybins grid spanning the plotted area; with one cell per pixel, markers
+    of the decimated set cover the same pixels as those of the full set
+    :param x: array of x-values
+    :param y: array of y-values
+    :param x_min: lower x boundary
+    :param x_max: upper x boundary
+    :param y_min: lower y boundary
+    :param y_max: upper y boundary
+    :param n_xbins: number of x-intervals (e.g. axes width in pixels)
+    :param n_ybins: number of y-intervals (e.g. axes height in pixels)
+    :return: decimated x and y arrays (in original order)
+    """
+    x_bins = ((x - x_min) * (n_xbins / (x_max - x_min))).astype(np.intp)
+    y_bins = ((y - y_min) * (n_ybins / (y_max - y_min))).astype(np.intp)
+    np.clip(x_bins, 0, n_xbins - 1, out=x_bins)
+    np.clip(y_bins, 0, n_ybins - 1, out=y_bins)
+
+    # keep the first point found in every occupied cell
+    _, keep = np.unique(x_bins * n_ybins + y_bins, return_index=True)
+    keep.sort()
+    return x[keep], y[keep]
+
+
+def _split_points(x, y, x_min, x_max, cutoff, acc_x, acc_y, rej_x, rej_y):
+    """ Single-pass kernel for classify_points(); writes accepted and rejected
+    points into the provided output arrays and returns their respective counts
+    """
+    n_acc = 0
+    n_rej = 0
+    for i in range(x.shape[0]):
+        if x_min < x[i] < x_max:
+            if y[i] >= cutoff:
+                acc_x[n_acc] = x[i]
+                acc_y[n_acc] = y[i]
+                n_acc += 1
+            if y[i] <= cutoff:
+                rej_x[n_rej] = x[i]
+                rej_y[n_rej] = y[i]
+                n_rej += 1
+    return n_acc, n_rej
+
+
+if njit is not None:
+    _split_points = njit(cache=True)(_split_points)
+
+
+def _classify_with_masks(x, y, x_min, x_max, cutoff):
+    """ NumPy implementation of classify_points() """
+    in_bounds = (x > x_min) & (x < x_max)
+    acc = in_bounds & (y >= cutoff)
+    rej = in_bounds & (y <= cutoff)
+    return x[acc], y[acc], x[rej], y[rej]
+
+
+def _classify_with_kernel(x, y, x_min, x_max, cutoff, out=None):
+    """ Single-pass (Numba-compiled, if available) implementation of
+    classify_points() """
+    if out is None:
+        out = (np.empty_like(x), np.empty_like(y), np.empty_like(x), np.empty_like(y))
+    acc_x, acc_y, rej_x, rej_y = out
+    n_acc, n_rej = _split_points(
+        x, y, float(x_min), float(x_max), float(cutoff), acc_x, acc_y, rej_x, rej_y
+    )
+    # results are copied out, since the scratch buffers are reused by the next
+    # call while the returned arrays may still be held on to (e.g. by plots)
+    return (
+        acc_x[:n_acc].copy(),
+        acc_y[:n_acc].copy(),
+        rej_x[:n_rej].copy(),
+        rej_y[:n_rej].copy(),
+    )
+
+
+def classify_points(x, y, x_min, x_max, cutoff, out=None):
+    """ Select points that are within the x-boundaries and split them into
+    accepted (at or above the cutoff) and rejected (at or below the cutoff)
+    points; uses a compiled single-pass kernel if Numba is available
+    :param x: array of x-values
+    :param y: array of y-values
+    :param x_min: lower x boundary (exclusive)
+    :param x_max: upper x boundary (exclusive)
+    :param cutoff: y-value cutoff
+    :param out: optional scratch buffers for the compiled kernel (four arrays of
+    at least len(x) elements, for accepted x / y and rejected x / y)
+    :return: arrays of accepted x, accepted y, rejected x and rejected y
+    """
+    if njit is None:
+        return _classify_with_masks(x, y, x_min, x_max, cutoff)
+    return _classify_with_kernel(x, y, x_min, x_max, cutoff, out=out)
@@ -13,6 +13,17 @@ import zmq
 import numpy as np
 import wx
 
+# Per-frame spotfinding results, as sent to the GUI
+FRAME_DTYPE = np.dtype(
+    [
+        ("run_no", "i4"),
+        ("frame_idx", "i4"),
+        ("n_spots", "i4"),
+        ("indexed", "f4"),
+        ("hres", "f4"),
+    ]
+)
+
 
 class Receiver(Thread):
     def __init__(self, parent):
@@ -46,17 +57,20 @@ class Receiver(Thread):
                 result_string = data_string.split('result ')[1].split(' mapping')[0]
                 results = result_string[1:-1].split()
 
-                data = {
-                    "run_no": run_no,
-                    "frame_idx": frame_idx,
-                    "n_spots": results[0],
-                    "hres": results[3],
-                }
+                n_spots = int(results[0])
                 # mark frame if indexed
                 sg = results[6]
-                data["indexed"] = data["n_spots"] if sg != "NA" else np.nan
-                if data:
-                    self.all_info.append(data)
+                indexed = n_spots if sg != "NA" else np.nan
+
+                # record in the same field order as FRAME_DTYPE
+                data = (
+                    int(run_no),
+                    int(frame_idx),
+                    n_spots,
+                    indexed,
+                    float(results[3]),
+                )
+                self.all_info.append(data)
 
         # Once loop exits, disconnect socket
         print("DISCONNECTING...")
@@ -70,7 +84,7 @@ class Receiver(Thread):
             # doing it this way because self.all_info is being appended at up to
             # 100Hz, or faster. Thus, setting a hard end so that no information is
             # plotted twice or missed
-            info = self.all_info[start:end]
+            info = np.array(self.all_info[start:end], dtype=FRAME_DTYPE)
             self.send_to_gui(info=info)
             self.bookmark = end
 
@@ -10,12 +10,19 @@ Description : Interceptor tracking module (GUI elements)
 import numpy as np
 import wx
 
+# Lock in the WXAgg backend before anything else imports matplotlib.pyplot;
+# this module must therefore be imported before any code that uses pyplot
+import matplotlib
+
+matplotlib.use("WXAgg", force=True)
+
 from matplotlib.backends.backend_wxagg import FigureCanvasWxAgg as FigureCanvas
 from matplotlib.figure import Figure
 from matplotlib.widgets import SpanSelector
 
 from iota.components.gui import controls as ct
-from interceptor.gui import receiver as rcv, find_icon
+from interceptor.gui import receiver as rcv, find_icon, preload_icons
+from interceptor.gui.chart_utils import axis_step, classify_points, decimate_points
 from interceptor import packagefinder
 
 blconfig = packagefinder('beamlines.cfg', 'connector', read_config=True)
@@ -23,6 +30,24 @@ uiconfig = packagefinder('ui.cfg', 'connector', read_config=True)
 
 icon_cache = {}
 
+# all icons used by the tracker window, as icon_fn: find_icon kwargs; icons
+# must be loaded via tracker_icon() so that they match the preloaded bitmaps
+tracker_icons = {
+    "zoom": {"size": 24},
+    "back": {"size": 24},
+    "forward": {"size": 24},
+    "max": {"size": 24},
+    "network": {"size": 32},
+    "exit": {"size": 32},
+    "connected": {"library": "custom"},
+    "disconnected": {"library": "custom"},
+}
+
+
+def tracker_icon(icon_fn):
+    return find_icon(icon_fn, **tracker_icons[icon_fn])
+
+
 itx_EVT_ZOOM = wx.NewEventType()
 EVT_ZOOM = wx.PyEventBinder(itx_EVT_ZOOM, 1)
 
@@ -55,16 +80,16 @@ class ZoomCtrl(ct.CtrlBase):
 
         # Zoom checkbox
         btn_size = (32, 32)
-        zoom_bmp = find_icon("zoom", size=24)
+        zoom_bmp = tracker_icon("zoom")
         self.btn_zoom = wx.BitmapToggleButton(self, label=zoom_bmp, size=btn_size)
         self.spn_zoom = ct.SpinCtrl(
             self, ctrl_size=(100, -1), ctrl_value=100, ctrl_min=10, ctrl_step=10
         )
-        back_bmp = find_icon("back", size=24)
+        back_bmp = tracker_icon("back")
         self.btn_back = wx.BitmapButton(self, bitmap=back_bmp, size=btn_size)
-        frwd_bmp = find_icon("forward", size=24)
+        frwd_bmp = tracker_icon("forward")
         self.btn_frwd = wx.BitmapButton(self, bitmap=frwd_bmp, size=btn_size)
-        xmax_bmp = find_icon("max", size=24)
+        xmax_bmp = tracker_icon("max")
         self.btn_lock = wx.BitmapToggleButton(self, label=xmax_bmp, size=btn_size)
 
         main_sizer.Add(self.btn_zoom, pos=(0, 0))
@@ -150,7 +175,7 @@ class TrackStatusBar(wx.StatusBar):
         self.Bind(wx.EVT_SIZE, self.OnSize)
         self.Bind(wx.EVT_IDLE, self.OnIdle)
 
-        bmp = find_icon("disconnected", library="custom")
+        bmp = tracker_icon("disconnected")
         self.conn_icon = wx.StaticBitmap(self, bitmap=bmp)
 
         icon_width = self.conn_icon.GetSize()[0] + 10
@@ -168,9 +193,9 @@ class TrackStatusBar(wx.StatusBar):
 
     def SetStatusBitmap(self, connected=False):
         if connected:
-            bmp = find_icon("connected", library="custom")
+            bmp = tracker_icon("connected")
         else:
-            bmp = find_icon("disconnected", library="custom")
+            bmp = tracker_icon("disconnected")
         self.conn_icon.SetBitmap(bmp)
         self.position_icon()
 
@@ -216,6 +241,12 @@ class TrackChart(wx.Panel):
 
         # Plot bindings
         self.track_figure.canvas.mpl_connect("button_press_event", self.onPress)
+        self.track_figure.canvas.mpl_connect("draw_event", self.onDraw)
+
+        # last values set to run stats labels (to skip unchanged updates)
+        self._last_labels = {}
+        self._sb_shown = self.plot_sb.IsShown()
+        self._last_sb_state = None
 
         # initialize chart
         self.reset_chart()
@@ -231,11 +262,8 @@ class TrackChart(wx.Panel):
             self.chart_range = int(self.x_max - self.x_min)
             sb_center = self.x_min + self.chart_range / 2
 
-            self.plot_sb.SetScrollbar(
-                position=sb_center,
-                thumbSize=self.chart_range,
-                range=np.max(self.xdata),
-                pageSize=self.chart_range,
+            self._set_scrollbar(
+                position=sb_center, size=self.chart_range, range=self._x_max_data
             )
             self.plot_sb.Show()
             self.zoom_ctrl.set_control(
@@ -261,16 +289,13 @@ class TrackChart(wx.Panel):
         else:
             self.plot_sb.Show()
             sb_center = self.x_min + self.chart_range / 2
-            range = np.max(self.xdata) if self.xdata.size else self.chart_range
-            self.plot_sb.SetScrollbar(
-                position=sb_center,
-                thumbSize=self.chart_range,
-                range=range,
-                pageSize=self.chart_range,
-            )
+            range = self._x_max_data if self._n else self.chart_range
+            self._set_scrollbar(position=sb_center, size=self.chart_range, range=range)
         self.draw_plot()
 
     def onScroll(self, e):
+        # scrollbar was moved by the user, so its last known state is stale
+        self._last_sb_state = None
         sb_center = self.plot_sb.GetThumbPosition()
         half_span = (self.x_max - self.x_min) / 2
         if sb_center - half_span == 0:
@@ -294,6 +319,7 @@ class TrackChart(wx.Panel):
     otherwise, makes the span invisible """
         if e.button != 1:
             self.zoom_span.set_visible(False)
+            self._bg = None
             self.bracket_set = False
             self.plot_zoom = False
             self.plot_sb.Hide()
@@ -304,15 +330,34 @@ class TrackChart(wx.Panel):
         else:
             self.zoom_span.set_visible(True)
 
+    def onDraw(self, e):
+        """ Called after every full draw of the canvas; saves the background
+        (everything but the data points) for blitting, then draws the data
+        points, which are animated and thus skipped by the full draw """
+        self._bg = self.track_canvas.copy_from_bbox(self.track_axes.bbox)
+        self._draw_data_artists()
+
     def reset_chart(self):
         self.track_axes.clear()
         self.track_figure.patch.set_visible(False)
         self.track_axes.patch.set_visible(False)
 
-        self.xdata = np.array([]).astype(np.double)
-        self.ydata = np.array([]).astype(np.double)
-        self.idata = np.array([]).astype(np.double)
-        self.rdata = []
+        # data are kept in preallocated buffers that grow by doubling; only the
+        # first self._n entries are valid. Types match rcv.FRAME_DTYPE: frame
+        # indices and spot counts are integers, indexed and resolution are float
+        # (indexed is NaN for frames that were not indexed)
+        self._cap = 1024
+        self._n = 0
+        self._x_max_data = 0
+        self._y_max_data = 0
+        self._idx_count = 0
+        self.xdata = np.empty(self._cap, dtype=np.int32)
+        self.ydata = np.empty(self._cap, dtype=np.int32)
+        self.idata = np.empty(self._cap, dtype=np.float32)
+        self.rdata = np.empty(self._cap, dtype=np.float32)
+        self._alloc_split_buffers()
+        self._rdata_dirty = True
+        self._last_median = None
         self.x_min = 0
         self.x_max = 1
         self.y_max = 1
@@ -327,10 +372,17 @@ class TrackChart(wx.Panel):
         self.patch_width = 1
         self.start_edge = 0
         self.end_edge = 1
-
-        self.acc_plot = self.track_axes.plot([], [], "o", color="#4575b4")[0]
-        self.rej_plot = self.track_axes.plot([], [], "o", color="#d73027")[0]
-        self.idx_plot = self.track_axes.plot([], [], "wo", ms=2)[0]
+        self._bg = None
+        self._last_limits = None
+        self._axes_limits = None
+
+        self.acc_plot = self.track_axes.plot(
+            [], [], "o", color="#4575b4", animated=True
+        )[0]
+        self.rej_plot = self.track_axes.plot(
+            [], [], "o", color="#d73027", animated=True
+        )[0]
+        self.idx_plot = self.track_axes.plot([], [], "wo", ms=2, animated=True)[0]
         self.bragg_line = self.track_axes.axhline(0, c="#4575b4", ls=":", alpha=0)
         self.highlight = self.track_axes.axvspan(
             0.5, 0.5, ls="--", alpha=0, fc="#deebf7", ec="#2171b5"
@@ -346,6 +398,73 @@ class TrackChart(wx.Panel):
         self.zoom_span.set_active(True)
         self._update_canvas(canvas=self.track_canvas)
 
+    def _extend(self, new_data):
+        """ Append a batch of frames to the data buffers, growing them (by
+        doubling capacity) when necessary
+    :param new_data: a structured array of frames (dtype is rcv.FRAME_DTYPE)
+    """
+        start = self._n
+        end = start + len(new_data)
+        if end > self._cap:
+            self._cap = max(self._cap * 2, end)
+            for name in ("xdata", "ydata", "idata", "rdata"):
+                setattr(self, name, np.resize(getattr(self, name), self._cap))
+            self._alloc_split_buffers()
+
+        self.xdata[start:end] = new_data["frame_idx"]
+        self.ydata[start:end] = new_data["n_spots"]
+        self.idata[start:end] = new_data["indexed"]
+        self.rdata[start:end] = new_data["hres"]
+        if end > start:
+            # data are append-only, so running maxima are kept up to date here
+            self._x_max_data = max(self._x_max_data, self.xdata[start:end].max())
+            self._y_max_data = max(self._y_max_data, self.ydata[start:end].max())
+        self._idx_count += int(np.count_nonzero(~np.isnan(new_data["indexed"])))
+        self._n = end
+        self._rdata_dirty = True
+
+    def _alloc_split_buffers(self):
+        """ (Re)allocate scratch buffers for classify_points(), sized to the data
+        buffer capacity, so they are not allocated anew on every draw """
+        self._split_out = tuple(np.empty(self._cap, dtype=np.int32) for _ in range(4))
+
+    def _step_x_max(self, span):
+        """ Set the upper x boundary to the next multiple of a round step (at
+        most 10% of the span) past the latest frame. The boundary (and thus the
+        axes limits) only changes when new frames cross a step, so batches that
+        land within the current limits are blitted instead of triggering a full
+        redraw; it is always re-anchored to the data, so a changed span (e.g.
+        zooming in) never leaves the latest frames outside the plotted range
+    :param span: width of the plotted x-range
+    """
+        step = axis_step(span)
+        self.x_max = (int(self._x_max_data) // step + 1) * step
+
+    def _set_scrollbar(self, position, size, range):
+        """ Set zoom scrollbar position, thumb / page size and range; skipped if
+        none of these have changed, since SetScrollbar() triggers a repaint """
+        sb_state = (position, size, range)
+        if sb_state == self._last_sb_state:
+            return
+        self._last_sb_state = sb_state
+        self.plot_sb.SetScrollbar(
+            position=position, thumbSize=size, range=range, pageSize=size,
+        )
+
+    def _set_label(self, txt_name, label):
+        """ Set label of a run stats text widget (if it has changed)
+    :param txt_name: name of the text widget attribute of the tracker panel
+    :param label: new label string
+    :return: True if the label length changed (i.e. layout is needed)
+    """
+        last_label = self._last_labels.get(txt_name)
+        if last_label == label:
+            return False
+        txt = getattr(self.main_window.tracker_panel, txt_name)
+        txt.SetLabel(label)
+        self._last_labels[txt_name] = label
+        return last_label is None or len(last_label) != len(label)
+
     def draw_bragg_line(self):
         min_bragg = self.main_window.tracker_panel.min_bragg.ctr.GetValue()
         if min_bragg > 0:
@@ -358,58 +477,35 @@ class TrackChart(wx.Panel):
         except AttributeError:
             pass
 
-    def draw_plot(
-        self, new_data=None, new_res=None, new_x=None, new_y=None, new_i=None
-    ):
+    def draw_plot(self, new_data=None):
         """ Draw plot from acquired data; called on every timer event or forced
         when the Bragg spot count cutoff line is moved, or when current run tab
         is clicked on
-    :param new_data: a list of tuples containing (frame_idx, no_spots, hres)
-    :param new_res: a list of resolutions (hres, deprecated)
-    :param new_x: a list of x-values (frame_idx, deprecated)
-    :param new_y: a list of y-values (no_spots, deprecated)
-    :param new_i: a list of x-values for indexed frames
+    :param new_data: a list of structured arrays of frames (dtype is
+    rcv.FRAME_DTYPE, i.e. run_no, frame_idx, n_spots, indexed, hres)
     """
 
         # get Bragg spots count cutoff line from UI widget
         min_bragg = self.main_window.tracker_panel.min_bragg.ctr.GetValue()
 
-        # append new data (if available) to data lists
+        # append new data (if available) to data buffers
         if new_data:
-            new_x, new_y, new_i, new_res = list(zip(*new_data))
-        if new_x and new_y:
-            new_x_arr = np.array(new_x).astype(np.double)
-            nref_x = np.append(self.xdata, new_x_arr)
-            self.xdata = nref_x
-            new_y_arr = np.array(new_y).astype(np.double)
-            nref_y = np.append(self.ydata, new_y_arr)
-            self.ydata = nref_y
-        else:
-            nref_x = self.xdata
-            nref_y = self.ydata
-
-        if new_res:
-            new_res_arr = np.array(new_res).astype(np.double)
-            self.rdata = np.append(self.rdata, new_res_arr)
-
-        if new_i:
-            new_i_arr = np.array(new_i).astype(np.double)
-            nref_i = np.append(self.idata, new_i_arr)
-            self.idata = nref_i
-        else:
-            nref_i = self.idata
+            for block in new_data:
+                self._extend(block)
 
-        nref_xy = list(zip(nref_x, nref_y))
+        nref_x = self.xdata[: self._n]
+        nref_y = self.ydata[: self._n]
+        nref_i = self.idata[: self._n]
 
         # identify plotted data boundaries
-        if nref_x != [] and nref_y != []:
+        if nref_x.size and nref_y.size:
             if self.plot_zoom:
                 if self.max_lock:
-                    self.x_max = np.max(nref_x)
+                    self._step_x_max(span=self.chart_range)
                     self.x_min = self.x_max - self.chart_range
                 else:
-                    if self.x_max >= np.max(nref_x):
-                        self.x_max = np.max(nref_x)
+                    if self.x_max >= self._x_max_data:
+                        self.x_max = self._x_max_data
                         self.max_lock = True
                     else:
                         self.max_lock = False
@@ -417,15 +513,18 @@ class TrackChart(wx.Panel):
                         self.x_min = 0
             else:
                 self.x_min = 0
-                self.x_max = np.max(nref_x) + 1
+                self._step_x_max(span=self._x_max_data)
 
-            if min_bragg > np.max(nref_y):
+            if min_bragg > self._y_max_data:
                 self.y_max = min_bragg + int(0.1 * min_bragg)
             else:
-                self.y_max = np.max(nref_y) + int(0.1 * np.max(nref_y))
+                self.y_max = self._y_max_data + int(0.1 * self._y_max_data)
 
-            self.track_axes.set_xlim(self.x_min, self.x_max)
-            self.track_axes.set_ylim(0, self.y_max)
+            axes_limits = (self.x_min, self.x_max, self.y_max)
+            if axes_limits != self._axes_limits:
+                self._axes_limits = axes_limits
+                self.track_axes.set_xlim(self.x_min, self.x_max)
+                self.track_axes.set_ylim(0, self.y_max)
 
         else:
             self.x_min = -1
@@ -433,76 +532,100 @@ class TrackChart(wx.Panel):
 
         # select results that are a) within the plotted boundaries and b) are above
         # (acc) or below (rej) the minimum found Bragg spots cutoff
-        acc = [
-            i for i in nref_xy if (self.x_min < i[0] < self.x_max and i[1] >= min_bragg)
-        ]
-        rej = [
-            i for i in nref_xy if (self.x_min < i[0] < self.x_max and i[1] <= min_bragg)
-        ]
-
-        # exit if there's nothing to plot
-        if not acc and not rej:
+        acc_x, acc_y, rej_x, rej_y = classify_points(
+            nref_x, nref_y, self.x_min, self.x_max, min_bragg, out=self._split_out
+        )
+        acc_count = len(acc_x)
+        rej_count = len(rej_x)
+
+        # exit if there's nothing to plot (but still show a changed empty view)
+        if not acc_count and not rej_count:
+            limits = (self.x_min, self.x_max, self.y_max, min_bragg)
+            if self._n and limits != self._last_limits:
+                self._last_limits = limits
+                self._update_canvas(self.track_canvas)
             return
 
-        # split acc/rej lists into x and y lists
-        acc_x = [int(i[0]) for i in acc]
-        acc_y = [int(i[1]) for i in acc]
-        rej_x = [int(i[0]) for i in rej]
-        rej_y = [int(i[1]) for i in rej]
+        # if there are many more points than pixel columns, plot only one point
+        # per occupied pixel; markers at the same pixel position overlap exactly
+        width = int(self.track_axes.bbox.width)
+        height = int(self.track_axes.bbox.height)
+        if width > 0 and height > 0 and self.y_max > 0:
+            if acc_count > 4 * width:
+                acc_x, acc_y = decimate_points(
+                    acc_x, acc_y, self.x_min, self.x_max, 0, self.y_max, width, height
+                )
+            if rej_count > 4 * width:
+                rej_x, rej_y = decimate_points(
+                    rej_x, rej_y, self.x_min, self.x_max, 0, self.y_max, width, height
+                )
 
         # update plot data
-        if acc_x:
-            self.acc_plot.set_xdata(acc_x)
-            self.acc_plot.set_ydata(acc_y)
-        if rej_x:
-            self.rej_plot.set_xdata(rej_x)
-            self.rej_plot.set_ydata(rej_y)
-
-        # plot indexed
-        if new_i is not None:
-            self.idx_plot.set_xdata(nref_x)
-            self.idx_plot.set_ydata(nref_i)
-            idx_count = "{}".format(len(nref_i[~np.isnan(nref_i)]))
-            self.main_window.tracker_panel.idx_count_txt.SetLabel(idx_count)
-
-        self.Layout()
+        if acc_count:
+            self.acc_plot.set_data(acc_x, acc_y)
+        if rej_count:
+            self.rej_plot.set_data(rej_x, rej_y)
+
+        # plot indexed and update indexed count (both only change with new data)
+        need_layout = False
+        if new_data:
+            self.idx_plot.set_data(nref_x, nref_i)
+            idx_count = "{}".format(self._idx_count)
+            need_layout |= self._set_label("idx_count_txt", idx_count)
+
+        # only re-layout the chart panel if the scrollbar was shown or hidden
+        if self.plot_sb.IsShown() != self._sb_shown:
+            self._sb_shown = self.plot_sb.IsShown()
+            self.Layout()
 
         # update run stats
         # hit count
-        count = "{}".format(len(acc))
-        self.main_window.tracker_panel.count_txt.SetLabel(count)
-        self.main_window.tracker_panel.info_sizer.Layout()
+        count = "{}".format(acc_count)
+        need_layout |= self._set_label("count_txt", count)
 
-        # indexed count
-        idx_count = "{}".format(len(nref_i[~np.isnan(nref_i)]))
-        self.main_window.tracker_panel.idx_count_txt.SetLabel(idx_count)
+        # Median resolution (only recalculated if new resolutions were added)
+        if self._rdata_dirty:
+            self._last_median = np.median(self.rdata[: self._n])
+            self._rdata_dirty = False
+        res_label = "{:.2f} Å".format(self._last_median)
+        need_layout |= self._set_label("res_txt", res_label)
 
-        # Median resolution
-        median_res = np.median(self.rdata)
-        res_label = "{:.2f} Å".format(median_res)
-        self.main_window.tracker_panel.res_txt.SetLabel(res_label)
-
-        # Draw extended plots
-        self.track_axes.draw_artist(self.acc_plot)
-        self.track_axes.draw_artist(self.rej_plot)
+        if need_layout:
+            self.main_window.tracker_panel.info_sizer.Layout()
 
         # If zoomed update navigation tools
         if self.chart_range:
             # Adjust scrollbar
-            rng = np.max(self.xdata)
+            rng = self._x_max_data
             pos = rng if self.max_lock else self.plot_sb.GetThumbPosition()
-            self.plot_sb.SetScrollbar(
-                position=pos,
-                thumbSize=self.chart_range,
-                range=rng,
-                pageSize=self.chart_range,
-            )
+            self._set_scrollbar(position=pos, size=self.chart_range, range=rng)
 
             # Update Zoom control
             self.zoom_ctrl.set_control(max_lock=self.max_lock,)
 
-        # Redraw canvas
-        self._update_canvas(self.track_canvas)
+        # Redraw canvas; a full redraw is only needed if the plot boundaries or
+        # the Bragg spots cutoff line have changed, otherwise the data points
+        # are blitted onto the saved background
+        limits = (self.x_min, self.x_max, self.y_max, min_bragg)
+        if self._bg is None or limits != self._last_limits:
+            self._last_limits = limits
+            self._update_canvas(self.track_canvas)
+        else:
+            self._blit_canvas()
+
+    def _draw_data_artists(self):
+        self.track_axes.draw_artist(self.acc_plot)
+        self.track_axes.draw_artist(self.rej_plot)
+        self.track_axes.draw_artist(self.idx_plot)
+
+    def _blit_canvas(self):
+        """ Restore the saved chart background, draw the data points over it and
+        blit the axes region onto the canvas """
+        self.track_canvas.restore_region(self._bg)
+        self._draw_data_artists()
+        # FigureCanvasWxAgg.blit() wraps the Agg buffer_rgba() memoryview in a wx
+        # bitmap directly; pixels should never be grabbed via tostring_rgb/argb
+        self.track_canvas.blit(self.track_axes.bbox)
 
     def _update_canvas(self, canvas, draw_idle=True):
         """ Update a canvas (passed as arg)
@@ -531,6 +654,8 @@ class TrackerPanel(wx.Panel):
 
         self.all_data = []
         self.new_data = []
+        self._seen = set()
+        self._dirty = False
         self.run_number = run_number
 
         self.main_sizer = wx.GridBagSizer(10, 10)
@@ -617,16 +742,32 @@ class TrackerPanel(wx.Panel):
         self.SetSizer(self.main_sizer)
 
     def update_plot(self, reset=False):
+        # nothing to do if no data were received since the last update
+        if not self._dirty and not reset:
+            return
+        self._dirty = False
+
         if reset:
+            # redraw all data (old and new) in a single pass
             self.chart.reset_chart()
-            self.chart.draw_plot(new_data=self.all_data)
-        self.chart.draw_plot(new_data=self.new_data)
+            self.chart.draw_plot(new_data=self.all_data + self.new_data)
+        else:
+            self.chart.draw_plot(new_data=self.new_data)
         self.all_data.extend(self.new_data)
         self.new_data = []
 
     def update_data(self, new_data):
-        new_data = [i for i in new_data if i not in self.all_data]
-        self.new_data.extend(new_data)
+        """ Queue frames for plotting, skipping frames already received
+    :param new_data: a structured array of frames (dtype is rcv.FRAME_DTYPE)
+    """
+        keep = []
+        for i, frame_idx in enumerate(new_data["frame_idx"].tolist()):
+            if frame_idx not in self._seen:
+                self._seen.add(frame_idx)
+                keep.append(i)
+        if keep:
+            self.new_data.append(new_data[keep])
+            self._dirty = True
 
 
 class TrackerWindow(wx.Frame):
@@ -634,6 +775,9 @@ class TrackerWindow(wx.Frame):
         wx.Frame.__init__(self, parent, id, title, size=(1500, 600))
         self.parent = parent
 
+        # load all icons at once, before any controls are created
+        preload_icons(tracker_icons.items())
+
         # initialize dictionary of tracker panels
         self.track_panels = {}
         self.all_info = []
@@ -675,7 +819,7 @@ class TrackerWindow(wx.Frame):
         self.tb_ctrl_port = self.toolbar.AddControl(control=ctr_port)
 
         # Connect toggle
-        sock_off_bmp = find_icon("network", size=32)
+        sock_off_bmp = tracker_icon("network")
         self.tb_btn_conn = self.toolbar.AddTool(
             toolId=wx.ID_ANY,
             label="Connect",
@@ -686,7 +830,7 @@ class TrackerWindow(wx.Frame):
 
         # Quit button
         self.toolbar.AddStretchableSpace()
-        quit_bmp = find_icon("exit", size=32)
+        quit_bmp = tracker_icon("exit")
         self.tb_btn_quit = self.toolbar.AddTool(
             toolId=wx.ID_EXIT,
             label="Quit",
@@ -811,37 +955,26 @@ class TrackerWindow(wx.Frame):
     def onCollectorInfo(self, e):
         """ Occurs on every wx.PostEvent instance; updates lists of images with
     spotfinding results """
-        info_list = e.GetValue()
-        self.all_info.extend(info_list)
-        new_data_dict = {}
-        if info_list:
-            for info in info_list:
-                run_no = info["run_no"]
-                if run_no not in self.track_panels:
-                    print("debug: creating new run #", run_no)
-                    self.create_new_run(run_no=run_no)
-                if run_no in new_data_dict:
-                    new_data_dict[run_no].append(
-                        (
-                            info["frame_idx"],
-                            info["n_spots"],
-                            info["indexed"],
-                            info["hres"],
-                        )
-                    )
-                else:
-                    new_data_dict[run_no] = [
-                        (
-                            info["frame_idx"],
-                            info["n_spots"],
-                            info["indexed"],
-                            info["hres"],
-                        )
-                    ]
-
-            # update track panel data
-            for run_no in new_data_dict:
-                self.track_panels[run_no].update_data(new_data=new_data_dict[run_no])
+        info = e.GetValue()
+        self.all_info.append(info)
+        if info.size:
+            run_nos, run_idx = np.unique(info["run_no"], return_inverse=True)
+            run_nos = run_nos.tolist()
+
+            # create tabs for all new runs at once (notebook is re-laid out once)
+            new_runs = [r for r in run_nos if r not in self.track_panels]
+            if new_runs:
+                self.track_nb.Freeze()
+                try:
+                    for run_no in new_runs:
+                        print("debug: creating new run #", run_no)
+                        self.create_new_run(run_no=run_no)
+                finally:
+                    self.track_nb.Thaw()
+
+            # split frames by run number and hand each run's frames to its panel
+            for i, run_no in enumerate(run_nos):
+                self.track_panels[run_no].update_data(new_data=info[run_idx == i])
 
         # update current plot
         self.tracker_panel.update_plot()
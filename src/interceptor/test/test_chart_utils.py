@@ -0,0 +1,97 @@
+"""
+Created     : 10/15/2026
+Last Changed: 10/15/2026
+Description : Unit tests for tracker chart data utilities
+"""
+
+import numpy as np
+import pytest
+
+from interceptor.gui import chart_utils as cu
+
+
+def classify_both(x, y, x_min, x_max, cutoff):
+    """ Run both classify_points() implementations and check that they agree """
+    masks = cu._classify_with_masks(x, y, x_min, x_max, cutoff)
+    kernel = cu._classify_with_kernel(x, y, x_min, x_max, cutoff)
+    for m, k in zip(masks, kernel):
+        assert m.dtype == k.dtype
+        np.testing.assert_array_equal(m, k)
+    return masks
+
+
+@pytest.mark.parametrize("dtype", [np.int32, np.float64])
+def test_classify_random(dtype):
+    rs = np.random.RandomState(0)
+    x = rs.permutation(10000).astype(dtype)
+    y = rs.poisson(25, 10000).astype(dtype)
+    acc_x, acc_y, rej_x, rej_y = classify_both(x, y, 100, 9000.5, 25)
+    assert np.all((acc_x > 100) & (acc_x < 9000.5) & (acc_y >= 25))
+    assert np.all((rej_x > 100) & (rej_x < 9000.5) & (rej_y <= 25))
+
+
+def test_classify_boundaries():
+    x = np.array([0, 1, 2, 3, 4], dtype=np.int32)
+    y = np.array([10, 5, 10, 15, 10], dtype=np.int32)
+    acc_x, acc_y, rej_x, rej_y = classify_both(x, y, 0, 4, 10)
+    # x boundaries are exclusive; y == cutoff is both accepted and rejected
+    np.testing.assert_array_equal(acc_x, [2, 3])
+    np.testing.assert_array_equal(acc_y, [10, 15])
+    np.testing.assert_array_equal(rej_x, [1, 2])
+    np.testing.assert_array_equal(rej_y, [5, 10])
+
+
+def test_classify_empty():
+    x = np.array([], dtype=np.int32)
+    y = np.array([], dtype=np.int32)
+    for result in classify_both(x, y, 0, 10, 5):
+        assert result.size == 0
+
+    # nothing within boundaries
+    x = np.array([20, 30], dtype=np.int32)
+    y = np.array([1, 50], dtype=np.int32)
+    for result in classify_both(x, y, 0, 10, 5):
+        assert result.size == 0
+
+
+def test_decimate_points():
+    rs = np.random.RandomState(0)
+    x = np.arange(1, 20001, dtype=np.int32)
+    y = rs.poisson(25, 20000).astype(np.int32)
+    dx, dy = cu.decimate_points(x, y, 0, 20001, 0, 60, 800, 300)
+
+    # one point per occupied cell, and every occupied cell is kept
+    def cells(xx, yy):
+        xb = ((xx - 0) * (800 / 20001)).astype(int)
+        yb = ((yy - 0) * (300 / 60)).astype(int)
+        return set(zip(xb.tolist(), yb.tolist()))
+
+    assert len(dx) == len(cells(dx, dy))
+    assert cells(dx, dy) == cells(x, y)
+    assert np.all(np.diff(dx) >= 0)
+
+
+@pytest.mark.parametrize(
+    "span, step",
+    [(0, 1), (19, 1), (20, 2), (50, 5), (100, 10), (999, 50), (1000, 100),
+     (10967, 1000)],
+)
+def test_axis_step(span, step):
+    assert cu.axis_step(span) == step
+
+
+def test_classify_reused_buffers():
+    rs = np.random.RandomState(1)
+    x = rs.permutation(1000).astype(np.int32)
+    y = rs.poisson(25, 1000).astype(np.int32)
+    out = tuple(np.empty(2048, dtype=np.int32) for _ in range(4))
+
+    first = cu._classify_with_kernel(x, y, 0, 500, 25, out=out)
+    first_copy = [a.copy() for a in first]
+    for m, k in zip(cu._classify_with_masks(x, y, 0, 500, 25), first):
+        np.testing.assert_array_equal(m, k)
+
+    # results must not change when the buffers are reused by a later call
+    cu._classify_with_kernel(x, y, 500, 1000, 10, out=out)
+    for a, b in zip(first, first_copy):
+        np.testing.assert_array_equal(a, b)